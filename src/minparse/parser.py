@@ -3,12 +3,10 @@ defines the internal business logic that minparse uses. All public symbols are
 imported via `import minparse` and can be retrieved via `minparse.__all__`. 
 """
 
+import collections
+import functools
 import os
-import re
 import sys
-import textwrap
-
-from types import EllipsisType
 
 from .types import (
     BIN, 
@@ -31,10 +29,15 @@ __all__ = [
 # Variables
 # ==========
 
-# These are accessed through functions because docstrings are amazing. 
+# These are accessed through functions because docstrings are amazing.
 _config: ParserConfig = ParserConfig()
 _result: ParserResult = ParserResult()
 
+# Compiled paragraph-split pattern, filled in lazily by _wrap_help_ambles so
+# that importing minparse does not pay for the re module. It is still compiled
+# only once per process.
+_amble_split_re = None
+
 
 def config() -> ParserConfig:
     """Configuration for the argument parser and auto help generator.
@@ -89,28 +92,63 @@ def result() -> ParserResult:
 # Initialization
 # ===============
 
+# Fingerprint of the config that last passed validation. Lets repeated parses
+# against an unchanged config skip the full validation walk. Reassigning any
+# config field invalidates it; mutating a config container in place between
+# parses does not, but the documented way to configure is whole assignments.
+_validated_fingerprint = None
+
+# Internal view of one optionals config tuple with named fields, so the code
+# below reads conf.short instead of the magic index conf[1].
+_OptConf = collections.namedtuple("_OptConf", ["type", "short", "long", "help"])
+
+# Lookup tables derived from the optionals config. They are rebuilt by
+# _check_config_integrity whenever the config fingerprint changes, so every
+# parse against an unchanged config reuses them instead of re-iterating the
+# config dict.
+_opt_confs: dict = {}
+_flag_map: dict = {}
+_short_char_map: dict = {}
+_long_tails: dict = {}
+
+
 def _check_config_integrity():
     # Attempt to catch any errors in configuration so that the parser will not
-    # crash to do, for example, bad variable types in the config. 
+    # crash to do, for example, bad variable types in the config.
+    global _validated_fingerprint, _opt_confs, _flag_map, _short_char_map, \
+        _long_tails
     pos_conf = config().positional_args
     opt_conf = config().optional_args
 
+    fingerprint = (
+        id(pos_conf), len(pos_conf), id(opt_conf), len(opt_conf),
+        config().program_name, config().help_preamble, config().help_postamble)
+    if fingerprint == _validated_fingerprint:
+        return
+
     seen_positional = set()
+    last = len(pos_conf) - 1
     for i, conf in enumerate(pos_conf):
-        if conf in seen_positional:
-            raise ParserConfigError(
-                f"The name of each positional must be unique: the name "
-                f"'{conf}' has been used multiple times in the config. ")
-        if i != len(pos_conf) - 1 and conf == Ellipsis:
+        is_last = i == last
+        if conf is Ellipsis:
+            # Identity test since Ellipsis is a singleton; == would dispatch
+            # to an arbitrary user-supplied __eq__. A trailing ellipsis is
+            # valid and needs none of the checks below.
+            if is_last:
+                continue
             raise ParserConfigError(
                 f"Ellipsis can only be the last list element of the "
                 f"positionals config: list element {i}, which is not the "
                 f"last list element, cannot be ellipsis. ")
-        if i == len(pos_conf) - 1 and type(conf) not in [str, EllipsisType]:
+        if conf in seen_positional:
+            raise ParserConfigError(
+                f"The name of each positional must be unique: the name "
+                f"'{conf}' has been used multiple times in the config. ")
+        if is_last and not isinstance(conf, str):
             raise ParserConfigError(
                 f"Each positional name must be a string: the last "
                 f"positional '{conf}' is not a string or ellipsis. ")
-        if i != len(pos_conf) - 1 and type(conf) is not str:
+        if not is_last and not isinstance(conf, str):
             raise ParserConfigError(
                 f"Each positional name must be a string: "
                 f"the name '{conf}' is not a string. ")
@@ -119,7 +157,7 @@ def _check_config_integrity():
     seen_short_flags = set()
     seen_long_flags = set()
     for arg, conf in opt_conf.items():
-        if type(arg) is not str:
+        if not isinstance(arg, str):
             raise ParserConfigError(
                 f"Each optional key must be a string: "
                 f"the optional '{arg}' is not a string. ")
@@ -132,8 +170,8 @@ def _check_config_integrity():
                 f"The zeroth index of each optionals config must be either "
                 f"BINARY_ONLY, NUMBER_ONLY, or STRING_ONLY: that is not the "
                 f"case for the '{arg}' optional. ")
-        if type(conf[1]) not in [str, type(None)] or \
-           type(conf[2]) not in [str, type(None)]:
+        if not isinstance(conf[1], (str, type(None))) or \
+           not isinstance(conf[2], (str, type(None))):
             raise ParserConfigError(
                 f"Each optional arguments must be a string: the flags "
                 f"for the optional '{arg}' is not a string. ")
@@ -146,8 +184,8 @@ def _check_config_integrity():
             raise ParserConfigError(
                 f"Short optional flags must be two characters long (e.g. -h, -v): "
                 f"that is not the case for the '{arg}' optional. ")
-        if (conf[1] and len(conf[1]) == 2 and not (conf[1][0] == "-")) or \
-           (conf[2] and len(conf[2]) >= 3 and not (conf[2][0] == "-" and conf[2][1] == "-")):
+        if (conf[1] and not conf[1].startswith("-")) or \
+           (conf[2] and not conf[2].startswith("--")):
             raise ParserConfigError(
                 f"Short optional flags must start with '-', and long optional flags "
                 f"must start with '--': that is not the case for the '{arg}' optional. ")
@@ -156,38 +194,43 @@ def _check_config_integrity():
             raise ParserConfigError(
                 f"The flag of each optional must be unique: the flags "
                 f"for the optional '{arg}' has been used multiple times. ")
-        if type(conf[3]) not in [str, type(None)]:
+        if not isinstance(conf[3], (str, type(None))):
             raise ParserConfigError(
                 f"Each help message must be a string: the help message "
                 f"for the optional '{arg}' is not a string. ")
         seen_short_flags.add(conf[1])
         seen_short_flags.add(conf[2])
 
-    if type(config().program_name) not in [str, type(None)]:
-        raise ParserConfigError(f"The program name must be of str type (or None)")
-    if type(config().help_preamble) not in [str, type(None)]:
-        raise ParserConfigError(f"The help preamble must be of str type (or None)")
-    if type(config().help_postamble) not in [str, type(None)]:
-        raise ParserConfigError(f"The help postamble must be of str type (or None)")
+    if not isinstance(config().program_name, (str, type(None))):
+        raise ParserConfigError("The program name must be of str type (or None)")
+    if not isinstance(config().help_preamble, (str, type(None))):
+        raise ParserConfigError("The help preamble must be of str type (or None)")
+    if not isinstance(config().help_postamble, (str, type(None))):
+        raise ParserConfigError("The help postamble must be of str type (or None)")
+
+    _opt_confs = {name: _OptConf._make(conf) for name, conf in opt_conf.items()}
+    _flag_map = _build_flag_map(_opt_confs)
+    _short_char_map = _build_short_char_map(_opt_confs)
+    _long_tails = {name: _long_flag_with_tail(conf) for name, conf in _opt_confs.items()}
+    _validated_fingerprint = fingerprint
 
 
 def _initialize_result(result):
     pos_conf = config().positional_args
-    opt_conf = config().optional_args
 
     for arg in pos_conf:
-        result._positional_args[arg] = ""
+        result.positional_args[arg] = ""
     if pos_conf and pos_conf[-1] is Ellipsis:
-        result._positional_args[pos_conf[-2]] = []
-        del result._positional_args[Ellipsis]
+        result.positional_args[pos_conf[-2]] = []
+        del result.positional_args[Ellipsis]
 
-    for arg, conf in opt_conf.items():
-        if conf[0] is BIN:
-            result._optional_args[arg] = False
-        if conf[0] is INT:
-            result._optional_args[arg] = 0
-        if conf[0] is STR:
-            result._optional_args[arg] = ""
+    for arg, conf in _opt_confs.items():
+        if conf.type is BIN:
+            result.optional_args[arg] = False
+        if conf.type is INT:
+            result.optional_args[arg] = 0
+        if conf.type is STR:
+            result.optional_args[arg] = ""
 
 
 # =====================
@@ -195,246 +238,303 @@ def _initialize_result(result):
 # =====================
 
 def _get_safe_term_width():
+    # Queries the terminal size via a syscall, so the helpers below take the
+    # width as a parameter computed once per _generate_help call rather than
+    # calling this once per wrapped line.
     SAFE_AREA_CHARS = 2
     width = os.get_terminal_size().columns
     return width - SAFE_AREA_CHARS
 
 
 def _long_flag_with_tail(conf):
-    type = conf[0]
-    tail = " <str>" if type is STR else ""
-    tail = " <int>" if type is INT else tail
-    return conf[2] + tail
-
-
-def _wrap_help_line(text, indent):
+    if not conf.long:
+        return ""
+    tail = " <str>" if conf.type is STR else ""
+    tail = " <int>" if conf.type is INT else tail
+    return conf.long + tail
+
+
+@functools.lru_cache(maxsize=32)
+def _get_wrapper(width, indent=0):
+    # textwrap.fill constructs a fresh TextWrapper on every call, so the
+    # wrapping helpers share one wrapper per (width, indent) pair instead. The
+    # cache stays small since the terminal width rarely changes mid-process.
+    # The import lives here (rather than at module top) to keep it off the
+    # minparse import path; the lru_cache means it runs a handful of times.
+    import textwrap
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=" " * indent,
+        subsequent_indent=" " * indent)
+
+
+def _wrap_help_line(text, indent, width):
     text = text.replace("\n", "")
-    text = textwrap.fill(text, width=_get_safe_term_width() - indent)
-    text = text.replace("\n", "\n" + " " * indent)
+    # The initial indent is sliced back off because the caller has already
+    # written the flag columns in front of the first line.
+    return _get_wrapper(width, indent).fill(text)[indent:]
+
+
+def _wrap_help_ambles(text, width):
+    # Fast path: a single-paragraph amble that already fits the terminal needs
+    # no splitting or rewrapping. isprintable rules out linebreaks and other
+    # whitespace that rewrapping would replace, and the strip comparison rules
+    # out edge whitespace that rewrapping would drop.
+    if len(text) <= width and text.isprintable() and text == text.strip():
+        return text
+
+    # Note: ChatGPT generated. The pattern matches one linebreak followed by
+    # one or more additional linebreaks (CR, LF, or CRLF) possibly separated
+    # by intermediate whitespace.
+    global _amble_split_re
+    if _amble_split_re is None:
+        import re
+        _amble_split_re = re.compile(r'(?:\r\n?|\n)(?:[ \t\f\v]*(?:\r\n?|\n))+')
+
+    # Splitting on the compiled pattern directly yields the paragraphs in one
+    # pass, instead of substituting "\n\n" and splitting on it afterwards.
+    text = _amble_split_re.split(text)
+    text = [_get_wrapper(width).fill(seg) for seg in text]
+    text = "\n\n".join(text)
     return text
 
 
-def _wrap_help_ambles(text):
-    # Note: ChatGPT generated. The pattern matches one linebreak followed by one
-    # or more additional linebreaks (CR, LF, or CRLF) possibly separated by
-    # intermediate whitespace. 
-    pattern = re.compile(r'(?:\r\n?|\n)(?:[ \t\f\v]*(?:\r\n?|\n))+')
-    text = pattern.sub("\n\n", text)
-    text = text.split("\n\n")
-    text = [textwrap.fill(seg, width=_get_safe_term_width()) for seg in text]
-    text = "\n\n".join(text)
-    return text
+_USAGE_PREFIX = "Usage: "
+_USAGE_INDENT = " " * len(_USAGE_PREFIX)
 
 
 def _generate_usage(pos_conf, opt_conf, program):
-    usage = ["Usage: " + program]
+    # Each usage line is accumulated as a list of tokens plus a running length
+    # and joined once at the end; appending with += on a str would recopy the
+    # whole line for every token added.
+    lines = []
+    tokens = [_USAGE_PREFIX + program]
+    length = len(tokens[0])
 
     if opt_conf:
-        usage[0] += " [options ...] "
+        tokens.append(" [options ...] ")
+        length += len(" [options ...] ")
 
     # Short flag generation
-    short_flags = ""
-    for _, conf in opt_conf.items():
-        if not conf[3] and conf[1]:
-            short_flags += conf[1][1]
+    short_flags = [conf.short[1] for conf in opt_conf.values() if not conf.help and conf.short]
     if short_flags:
-        usage[0] += "[-" + short_flags + "] "
+        token = "[-" + "".join(short_flags) + "] "
+        tokens.append(token)
+        length += len(token)
 
     # Long flag generation with line wrap
-    long_flags = []
-    for _, conf in opt_conf.items():
-        if not conf[3] and not conf[1]:
-            flag = _long_flag_with_tail(conf)
-            long_flags.append("[" + flag + "] ")
-    while long_flags:
-        if len(usage[-1] + long_flags[0]) >= 80:
-            usage.append(" " * len("Usage: "))
-        usage[-1] += long_flags[0]
-        long_flags = long_flags[1:]
-    
-    # Positionals generation with line wrap
+    for name, conf in opt_conf.items():
+        if not conf.help and not conf.short:
+            flag = "[" + _long_tails[name] + "] "
+            if length + len(flag) >= 80:
+                lines.append("".join(tokens))
+                tokens = [_USAGE_INDENT]
+                length = len(_USAGE_INDENT)
+            tokens.append(flag)
+            length += len(flag)
+
+    # Positionals generation with line wrap. The display list is built locally
+    # so the caller's config list is never mutated.
     if pos_conf and pos_conf[-1] is Ellipsis:
-        pos_conf.pop()
-        pos_conf[-1] += " ..."
+        pos_conf = pos_conf[:-2] + [pos_conf[-2] + " ..."]
     for arg in pos_conf:
-        if len(usage[-1] + arg) + 3 >= 80:
-            usage.append(" " * len("Usage: "))
-        usage[-1] += "[" + arg + "] "
-    usage[-1] += "\b"
-    return "\n".join(usage)
+        if length + len(arg) + 3 >= 80:
+            lines.append("".join(tokens))
+            tokens = [_USAGE_INDENT]
+            length = len(_USAGE_INDENT)
+        tokens.append("[" + arg + "] ")
+        length += len(arg) + 3
+
+    tokens.append("\b")
+    lines.append("".join(tokens))
+    return "\n".join(lines)
 
 
-def _generate_opt_lines(opt_conf):
+def _generate_opt_lines(opt_conf, width):
     if not opt_conf:
         return []
 
     opt_lines = []
     col_2_beg = 5
-    col_3_beg = 3 + col_2_beg + max(
-        len(_long_flag_with_tail(conf) or [])
-        for _, conf in opt_conf.items())
-
-    for _, conf in opt_conf.items():
-        line = ""
-        short = conf[1]
-        long = conf[2]
-        text = conf[3]
+    # The decorated long flags come precomputed from the _long_tails table,
+    # rather than being rebuilt once for the column width and once per row.
+    tails = _long_tails
+    col_3_beg = 3 + col_2_beg + max(map(len, tails.values()), default=0)
+
+    for name, conf in opt_conf.items():
+        short = conf.short
+        long = tails[name]
+        text = conf.help
         if not text:
             continue
 
+        # Collect the column fragments and join once; growing a str with +=
+        # recopies the accumulated line for every fragment.
+        parts = []
         if short:
-            line += " " * 2 + short + " "
+            parts.append(" " * 2 + short + " ")
         else:
-            line += " " * col_2_beg
+            parts.append(" " * col_2_beg)
         if long:
-            long = _long_flag_with_tail(conf)
-            line += long + " " * (col_3_beg - col_2_beg - len(long))
+            parts.append(long + " " * (col_3_beg - col_2_beg - len(long)))
         else:
-            line += " " * (col_3_beg - col_2_beg)
+            parts.append(" " * (col_3_beg - col_2_beg))
 
-        line += _wrap_help_line(text, col_3_beg)
-        opt_lines.append(line)
+        parts.append(_wrap_help_line(text, col_3_beg, width))
+        opt_lines.append("".join(parts))
 
     return opt_lines
 
 
 def _generate_help(result):
     program = config().program_name or os.path.basename(sys.argv[0])
-    pos_conf = config().positional_args.copy()
-    opt_conf = config().optional_args.copy()
+    pos_conf = config().positional_args
+    opt_conf = _opt_confs
     preamble = config().help_preamble
     postamble = config().help_postamble
-    
+    width = _get_safe_term_width()
+
     usage = _generate_usage(pos_conf, opt_conf, program)
-    opt_lines = _generate_opt_lines(opt_conf)
+    opt_lines = _generate_opt_lines(opt_conf, width)
     help = usage
 
     if preamble:
-        help += "\n\n" + _wrap_help_ambles(preamble)
+        help += "\n\n" + _wrap_help_ambles(preamble, width)
     if opt_lines:
         help += "\n\nOptions: \n" + "\n".join(opt_lines)
     if postamble:
-        help += "\n\n" + _wrap_help_ambles(postamble)
+        help += "\n\n" + _wrap_help_ambles(postamble, width)
 
-    result._generated_usage = usage
-    result._generated_help = help
+    result.generated_usage = usage
+    result.generated_help = help
 
 
 # =============
 # Flag parsing
 # =============
 
-def _is_regular_flag(flag):
-    return flag[0] == "-" and not _is_stacked_flag(flag)
-
-
-def _is_stacked_flag(flag):
-    return len(flag) >= 3  \
-        and flag[0] == "-" \
-        and flag[1] != "-"
-
-
-def _get_flag_name(arg):
-    # Returns the programmatic name of the flag from an argument, or otherwise
-    # None if the flag does not exist. 
-    opt_flags = config().optional_args
-    return next((
-        name for name, conf in opt_flags.items()
-        if conf[1] == arg or conf[2] == arg), None)
-
-
-def _next_positional_parser(result, args_left, pos_conf):
-    arg = args_left[0]
-    if not pos_conf:
+# Token kinds returned by _classify
+_TOKEN_POSITIONAL = 0
+_TOKEN_REGULAR = 1
+_TOKEN_STACKED = 2
+_TOKEN_DASHDASH = 3
+
+
+def _classify(arg):
+    # Classifies a CLI token with a single inspection of its leading
+    # characters, replacing the separate _is_regular_flag/_is_stacked_flag
+    # predicates that each re-read the same characters. A short flag with an
+    # attached value (e.g. -f=value) is a regular flag, not a stack of
+    # single-character flags.
+    if arg == "--":
+        return _TOKEN_DASHDASH
+    if not arg or arg[0] != "-":
+        return _TOKEN_POSITIONAL
+    if len(arg) >= 3 and arg[1] != "-" and "=" not in arg:
+        return _TOKEN_STACKED
+    return _TOKEN_REGULAR
+
+
+def _build_flag_map(opt_conf):
+    # Returns a dictionary mapping each short and long flag string to a tuple
+    # of the programmatic name and value type of its optional. Building this
+    # once lets the parsers look flags up in O(1) instead of scanning the
+    # whole optionals config for every token.
+    flag_map = {}
+    for name, conf in opt_conf.items():
+        if conf.short:
+            flag_map[conf.short] = (name, conf.type)
+        if conf.long:
+            flag_map[conf.long] = (name, conf.type)
+    return flag_map
+
+
+def _build_short_char_map(opt_conf):
+    # Maps the bare character of each short flag to its (name, type) pair so
+    # the stacked flag parser can validate every character with one dict
+    # lookup, without building a "-" + char string per character.
+    return {
+        conf.short[1]: (name, conf.type)
+        for name, conf in opt_conf.items() if conf.short}
+
+
+def _next_positional_parser(result, args, i, pos_conf, pos_i):
+    # Note: The following parsers consume tokens by advancing the index i into
+    # the fixed args tuple, and return the new index. Rebuilding the remaining
+    # args via slicing on every token would be quadratic in argv length.
+    arg = args[i]
+    if pos_i >= len(pos_conf):
         raise ParserUserError(
-            f"Too many arguments: unexpected "
-            f"positional '{arg}' received. ")
-    
-    name = pos_conf[0]
-    pos_result = result._positional_args
-    if len(pos_conf) == 2 and pos_conf[1] is Ellipsis:
+            f"Too many arguments: unexpected positional '{arg}' received. ")
+
+    name = pos_conf[pos_i]
+    pos_result = result.positional_args
+    if pos_i == len(pos_conf) - 2 and pos_conf[-1] is Ellipsis:
         pos_result[name].append(arg)
-        args_left[:] = args_left[1:]
-        # Note: The [:] is necessary here to operate on the referenced list,
-        # as opposed to reassigning the local args_left variable, so that the
-        # caller sees the change. Disclaimer: ChatGPT came up with this. 
     else:
         pos_result[name] = arg
-        args_left[:] = args_left[1:]
-        pos_conf[:] = pos_conf[1:]
+        pos_i += 1
+    return i + 1, pos_i
 
 
-def _next_regular_flag_parser(result, args_left, opt_conf):
-    arg = args_left[0]
-    name = _get_flag_name(arg)
+def _next_regular_flag_parser(result, args, i, flag_map):
+    arg = args[i]
+    # An attached value (--flag=value or -f=value) is split off in place with
+    # partition, instead of expanding the whole argv into synthetic "=" tokens
+    # ahead of time.
+    flag, eq, value = arg.partition("=")
+    name, tp = flag_map.get(flag, (None, None))
     if not name:
         raise ParserUserError(
-            f"Invalid flag received: option '{arg}' "
-            f"is not a valid argument. ")
-    
-    tp = opt_conf[name][0]
-    opt_result = result._optional_args
+            f"Invalid flag received: option '{flag}' is not a valid argument. ")
+
+    opt_result = result.optional_args
 
     if tp is BIN:
+        if eq:
+            raise ParserUserError(
+                f"Bad formatting: option '{flag}' does not accept an argument. ")
         opt_result[name] = True
-        args_left[:] = args_left[1:]
-        return
-    
-    if len(args_left) >= 3 and args_left[1] == "=":
-        opt_result[name] = args_left[2]
-        args_left[:] = args_left[3:]
-    elif len(args_left) >= 2 and args_left[1] != "=":
-        opt_result[name] = args_left[1]
-        args_left[:] = args_left[2:]
+        return i + 1
+
+    if eq:
+        opt_result[name] = value
+        i += 1
+    elif len(args) >= i + 2:
+        opt_result[name] = args[i + 1]
+        i += 2
     else:
         raise ParserUserError(
-            f"Bad formatting: mission argument "
-            f"for option '{arg}'. ")
-    
+            f"Bad formatting: mission argument for option '{arg}'. ")
+
     if tp is INT:
-        if opt_result[name].isdigit():
+        try:
             opt_result[name] = int(opt_result[name])
-        else:
+        except ValueError:
             raise ParserUserError(
-                f"Bad formatting: only integers "
-                f"argument allowed for option '{arg}'. ")
+                "Bad formatting: only integers argument allowed for "
+                f"option '{arg}'. ") from None
+    return i
 
 
-def _next_stacked_flag_parser(result, args_left, opt_conf):
-    arg = args_left[0]
+def _next_stacked_flag_parser(result, args, i, short_char_map):
+    arg = args[i]
+    result_storage = result.optional_args
 
     for char in arg[1:]:
-        unstacked_flag = "-" + char
-
-        name = _get_flag_name(unstacked_flag)
+        name, tp = short_char_map.get(char, (None, None))
         if not name:
             raise ParserUserError(
-                f"Invalid flag received: option '{unstacked_flag}' "
-                f"(in '{arg}') is not a argument. ")
+                f"Invalid flag received: option '-{char}' (in '{arg}') "
+                "is not a argument. ")
 
-        tp = opt_conf[name][0]
         if tp is not BIN:
             raise ParserUserError(
-                f"Bad formatting: option '{unstacked_flag}' "
-                f"(in '{arg}') cannot be stacked. ")
-        
-        result_storage = result._optional_args
-        result_storage[name] = True
-    args_left[:] = args_left[1:]
-
+                f"Bad formatting: option '-{char}' (in '{arg}') cannot "
+                "be stacked. ")
 
-def _split_equal_sgn(args):
-    result = []
-    for arg in args:
-        if arg == "=":
-            raise ParserUserError(f"Bad formatting: unexpected floating '=' sign. ")
-        if "=" in arg:
-            result.append(arg.split("=")[0])
-            result.append("=")
-            result.append(arg.split("=")[1])
-        else:
-            result.append(arg)
-    return result
+        result_storage[name] = True
+    return i + 1
 
 
 def parse_arguments(argv: list[str] | None = None) -> None:
@@ -452,26 +552,32 @@ def parse_arguments(argv: list[str] | None = None) -> None:
     _generate_help(result())
     _initialize_result(result())
 
-    args_left = argv or sys.argv[1:]
-    pos_config = config().positional_args.copy()
-    opt_config = config().optional_args.copy()
-    args_left = _split_equal_sgn(args_left)
+    pos_config = config().positional_args
+    flag_map = _flag_map
+    short_char_map = _short_char_map
+    args = tuple(argv or sys.argv[1:])
     no_more_optionals = False
+    res = result()
+    n = len(args)
+    i = 0
+    pos_i = 0
+
+    while i < n:
+        # Note: The following helper functions only parse the i-th arg (plus
+        # however many value tokens it consumes) and return the index of the
+        # next unparsed arg. This is why the loop does not end until the index
+        # reaches the end of the args tuple.
+        arg = args[i]
+        if arg == "=":
+            raise ParserUserError("Bad formatting: unexpected floating '=' sign. ")
 
-    while args_left:
-        # Note: The following helper functions only parses the 0th args_left and
-        # deletes everything that's already been parsed. This is why the loop
-        # does not end until args_left is empty.
-        if args_left[0] == "--":
+        kind = _classify(arg)
+        if kind == _TOKEN_DASHDASH:
             no_more_optionals = True
-            args_left = args_left[1:]
-            continue
-
-        if no_more_optionals:
-            _next_positional_parser(result(), args_left, pos_config)
-        elif _is_regular_flag(args_left[0]):
-            _next_regular_flag_parser(result(), args_left, opt_config)
-        elif _is_stacked_flag(args_left[0]):
-            _next_stacked_flag_parser(result(), args_left, opt_config)
+            i += 1
+        elif no_more_optionals or kind == _TOKEN_POSITIONAL:
+            i, pos_i = _next_positional_parser(res, args, i, pos_config, pos_i)
+        elif kind == _TOKEN_REGULAR:
+            i = _next_regular_flag_parser(res, args, i, flag_map)
         else:
-            _next_positional_parser(result(), args_left, pos_config)
\ No newline at end of file
+            i = _next_stacked_flag_parser(res, args, i, short_char_map)
\ No newline at end of file
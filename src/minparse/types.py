@@ -1,6 +1,6 @@
 """Do not import this file or use the symbols it defines by itself. This file
 defines the internal business logic that minparse uses. All public symbols are
-imported via `import minparse` and can be retrieved via `minparse.__all__`. 
+imported via `import minparse` and can be retrieved via `minparse.__all__`.
 """
 
 __all__ = [
@@ -22,92 +22,41 @@ INT = object() # The flag accepts any integer value
 class ParserConfig:
     """See config() for docstring"""
 
-    def __init__(self) -> None:
-        self._positional_args: list = []
-        self._optional_args: dict = {}
-        self._program_name: str | None = None
-        self._help_preamble: str | None = None
-        self._help_postamble: str | None = None
-
-
-    @property
-    def positional_args(self):
-        return self._positional_args
-    
-
-    @property
-    def optional_args(self):
-        return self._optional_args
-    
-
-    @property
-    def program_name(self):
-        return self._program_name
-    
-
-    @property
-    def help_preamble(self):
-        return self._help_preamble
-    
-
-    @property
-    def help_postamble(self):
-        return self._help_postamble
-
-
-    @positional_args.setter
-    def positional_args(self, value: list):
-        self._positional_args = value
-
-
-    @optional_args.setter
-    def optional_args(self, value: dict):
-        self._optional_args = value
+    # Plain slot attributes: the old property/setter pairs were straight
+    # passthroughs, and every access dispatched through a Python-level
+    # descriptor call. Slot access is a C-level load and saves the per
+    # instance __dict__.
+    __slots__ = (
+        "positional_args",
+        "optional_args",
+        "program_name",
+        "help_preamble",
+        "help_postamble",
+    )
 
-
-    @program_name.setter
-    def program_name(self, value: str):
-        self._program_name = value
-    
-
-    @help_preamble.setter
-    def help_preamble(self, value: str):
-        self._help_preamble = value
-
-
-    @help_postamble.setter
-    def help_postamble(self, value: str):
-        self._help_postamble = value
+    def __init__(self) -> None:
+        self.positional_args: list = []
+        self.optional_args: dict = {}
+        self.program_name: str | None = None
+        self.help_preamble: str | None = None
+        self.help_postamble: str | None = None
 
 
 class ParserResult:
     """See result() for docstring"""
 
-    def __init__(self) -> None:
-        self._positional_args: dict = {}
-        self._optional_args: dict = {}
-        self._generated_usage: str = ""
-        self._generated_help: str = ""
+    __slots__ = (
+        "positional_args",
+        "optional_args",
+        "generated_usage",
+        "generated_help",
+    )
 
-
-    @property
-    def positional_args(self):
-        return self._positional_args
-    
-
-    @property
-    def optional_args(self):
-        return self._optional_args
-    
-
-    @property
-    def generated_help(self):
-        return self._generated_help
-    
-
-    @property
-    def generated_usage(self):
-        return self._generated_usage
+    def __init__(self) -> None:
+        self.positional_args: dict = {}
+        self.optional_args: dict = {}
+        self.generated_usage: str = ""
+        self.generated_help: str = ""
 
 
 class ParserConfigError(Exception):
@@ -115,4 +64,4 @@ class ParserConfigError(Exception):
 
 
 class ParserUserError(Exception):
-    """Error for fatally incorrect command line arguments by the user"""
\ No newline at end of file
+    """Error for fatally incorrect command line arguments by the user"""